@@ -0,0 +1,467 @@
+"""Private helpers shared by the modules of the package."""
+
+from __future__ import annotations
+
+import functools
+import math
+import typing
+
+import numpy as np
+from scipy import special  # type: ignore[import-untyped]
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    import numpy.typing as npt
+
+
+# number of pairwise values kept in memory at once in tiled computations
+_TILE_ELEMENTS = 2**22
+# number of histogram bins used to locate the median of pairwise values
+_N_BINS = 4096
+# relative width of the median bins at which approximate pairwise medians stop
+_APPROX_RTOL = 2.0**-12
+# quantile estimation methods supported by order statistic selection
+_QUANTILE_METHODS = ("linear", "lower", "higher", "nearest")
+# number of elements per block in fused min/max, small enough to stay in cache
+_MIN_MAX_BLOCK = 2**16
+
+
+def _prep(x: np.ndarray) -> np.ndarray:
+    """Convert input to contiguous flat float64 array."""
+    return np.ascontiguousarray(x, dtype=np.float64).ravel()
+
+
+def _filter(x: np.ndarray, keep: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    """Convert input to flat float64 array with values selected by keep mask."""
+    _x = np.asarray(x)
+    # integer arrays can not contain nans or infs, so the mask is skipped
+    if _x.dtype.kind in "iub":
+        return _prep(_x)
+    # floats are masked in their own precision, so float32 input is upcast
+    # only after compaction and the mask reads half as many bytes
+    if _x.dtype.kind == "f":
+        _x = _x.ravel()
+        return _prep(_x[keep(_x)])
+    _x = _prep(_x)
+    return _x[keep(_x)]
+
+
+def _notnan(x: np.ndarray) -> np.ndarray:
+    """Convert input to flat float64 array and drop nans."""
+    return _filter(x, lambda v: ~np.isnan(v))
+
+
+def _finite(x: np.ndarray) -> np.ndarray:
+    """Convert input to flat float64 array and drop non-finite values."""
+    return _filter(x, np.isfinite)
+
+
+def _sorted_notnan(x: np.ndarray) -> np.ndarray:
+    """Sort the array and drop nans."""
+    _x = _notnan(x)
+    _x.sort()
+    return _x
+
+
+def _min_max(x: np.ndarray) -> tuple[float, float]:
+    """Calculate minimum and maximum of the array without nans."""
+    if len(x) == 0:
+        return np.nan, np.nan
+    if len(x) <= _MIN_MAX_BLOCK:
+        return x.min(), x.max()
+    # both reductions read the same cached block, so x is streamed from memory once
+    min_x, max_x = np.inf, -np.inf
+    for start in range(0, len(x), _MIN_MAX_BLOCK):
+        block = x[start : start + _MIN_MAX_BLOCK]
+        min_x = min(min_x, block.min())
+        max_x = max(max_x, block.max())
+    return min_x, max_x
+
+
+def _abs_dev(x: np.ndarray, center: float) -> np.ndarray:
+    """Calculate absolute deviations from the center in a single new array."""
+    dev = np.subtract(x, center)
+    return np.abs(dev, out=dev)
+
+
+@functools.lru_cache(maxsize=128)
+def _quantile_ranks(
+    n: int, qs: tuple[float, ...], method: str = "linear"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate order statistics needed for quantiles of the array of size n.
+
+    Returns the lower and upper ranks, the interpolation fraction and the unique
+    ranks to partition on. They depend only on n, q and method, so they are cached.
+    Methods other than linear select a single order statistic per quantile.
+    """
+    h = (n - 1) * np.asarray(qs, dtype=np.float64)
+    if method == "linear":
+        lo = np.floor(h).astype(np.intp)
+        hi = np.minimum(lo + 1, n - 1)
+        frac = h - lo
+    else:
+        rounding: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+            "lower": np.floor,
+            "higher": np.ceil,
+            "nearest": np.around,
+        }
+        lo = hi = rounding[method](h).astype(np.intp)
+        frac = np.zeros_like(h)
+    kth = np.unique(np.r_[lo, hi])
+    for arr in (lo, hi, frac, kth):
+        arr.flags.writeable = False
+    return lo, hi, frac, kth
+
+
+def _quantiles_partition(
+    x: np.ndarray,
+    qs: Sequence[float],
+    *,
+    overwrite: bool = False,
+    method: str = "linear",
+) -> np.ndarray:
+    """Calculate quantiles of the array with linear interpolation.
+
+    All required order statistics are selected with a single partition,
+    so the array does not have to be sorted. If `overwrite` is True,
+    the array is partitioned in place instead of being copied.
+    `method` could be one of "linear", "lower", "higher" or "nearest",
+    with the same meaning as in numpy.quantile.
+    """
+    if method not in _QUANTILE_METHODS:
+        msg = f"Parameter method should be one of {_QUANTILE_METHODS}."
+        raise ValueError(msg)
+    n = len(x)
+    if n == 0:
+        return np.full(len(qs), np.nan)
+    lo, hi, frac, kth = _quantile_ranks(n, tuple(qs), method)
+    if overwrite:
+        x.partition(kth)
+        part = x
+    else:
+        part = np.partition(x, kth)
+    if method != "linear":
+        return part[lo]
+    return part[lo] + (part[hi] - part[lo]) * frac
+
+
+def _quantiles_sorted(x: np.ndarray, qs: Sequence[float]) -> np.ndarray:
+    """Calculate quantiles of the non-empty sorted array with linear interpolation."""
+    lo, hi, frac, _ = _quantile_ranks(len(x), tuple(qs))
+    return x[lo] + (x[hi] - x[lo]) * frac
+
+
+def _columns(x: np.ndarray, dtype: npt.DTypeLike = np.float64) -> np.ndarray:
+    """Convert input to 2D array with observations along the first axis.
+
+    By default values are converted to float64, `dtype=None` keeps the input dtype.
+    """
+    _x = np.asarray(x, dtype=dtype)
+    if _x.ndim == 1:
+        return _x[:, None]
+    if _x.ndim != 2:  # noqa: PLR2004
+        msg = "Parameter x should be a 1D or 2D array."
+        raise ValueError(msg)
+    return _x
+
+
+def _quantiles_sorted_columns(
+    x: np.ndarray, counts: np.ndarray, qs: Sequence[float]
+) -> np.ndarray:
+    """Calculate quantiles of every column of column-wise sorted array.
+
+    Nans should be sorted to the end of each column, `counts` holds
+    the number of valid values per column. Empty columns get nans.
+    """
+    out = np.full((len(qs), x.shape[1]), np.nan)
+    valid = counts > 0
+    if not valid.any():
+        return out
+    h = np.multiply.outer(np.asarray(qs, dtype=np.float64), counts[valid] - 1)
+    lo = np.floor(h).astype(np.intp)
+    hi = np.minimum(lo + 1, counts[valid] - 1)
+    x_lo = np.take_along_axis(x[:, valid], lo, axis=0)
+    x_hi = np.take_along_axis(x[:, valid], hi, axis=0)
+    out[:, valid] = x_lo + (x_hi - x_lo) * (h - lo)
+    return out
+
+
+def _sum_sumsq(x: np.ndarray) -> tuple[float, float]:
+    """Calculate sum and sum of squares of the array ignoring nans."""
+    _x = _notnan(x)
+    return _x.sum(), np.dot(_x, _x)
+
+
+def _mean_std(x: np.ndarray) -> tuple[float, float]:
+    """Calculate mean and population standard deviation of the array."""
+    mean = x.mean()
+    dev = x - mean
+    return mean, np.sqrt(np.dot(dev, dev) / len(x))
+
+
+def _partition_median(x: np.ndarray, *, overwrite: bool = False) -> float:
+    """Calculate median of non-empty array with a single partition.
+
+    If `overwrite` is True, the array is partitioned in place instead of being copied.
+    """
+    n = len(x)
+    ranks = [(n - 1) // 2, n // 2]
+    if overwrite:
+        x.partition(ranks)
+        return np.mean(x[ranks])
+    return np.mean(np.partition(x, ranks)[ranks])
+
+
+def _median_abs_dev(x: np.ndarray) -> tuple[float, float]:
+    """Calculate median and mean absolute deviation from it of non-empty array.
+
+    The array is partitioned in place around the middle ranks. After that
+    the lower half is below the median and the upper half is above it,
+    so the sum of absolute deviations is a difference of two sums.
+    """
+    n = len(x)
+    ranks = [(n - 1) // 2, n // 2]
+    x.partition(ranks)
+    median = np.mean(x[ranks])
+    return median, (x[(n + 1) // 2 :].sum() - x[: n // 2].sum()) / n
+
+
+def _pwm_betas(x: np.ndarray, n_betas: int) -> np.ndarray:
+    """Calculate first probability weighted moments of the sorted array.
+
+    b_r = sum(c_i(r) * x_i) / n with c_i(r) = prod_{k<r} (i - k) / (n - 1 - k),
+    weights of each order are built up from the previous one.
+    """
+    n = len(x)
+    ranks = np.arange(n, dtype=np.float64)
+    weights = np.empty((n_betas, n))
+    weights[0] = 1.0
+    for r in range(1, n_betas):
+        np.multiply(weights[r - 1], (ranks - (r - 1)) / (n - r), out=weights[r])
+    return weights @ x / n
+
+
+def _upper_pairs(
+    x: np.ndarray,
+    func: Callable[..., np.ndarray],
+    start: int,
+    stop: int,
+    k: int,
+) -> np.ndarray:
+    """Calculate func(x[i], x[j]) for rows start <= i < stop and all j >= i + k.
+
+    Rows of the upper triangular are written one after another into
+    a flat buffer, so the lower triangular is never computed.
+    """
+    n = len(x)
+    sizes = n - k - np.arange(start, stop)
+    buf = np.empty(sizes.sum())
+    pos = 0
+    for i, size in zip(range(start, stop), sizes):
+        func(x[i], x[i + k :], out=buf[pos : pos + size])
+        pos += size
+    return buf
+
+
+def _window_bins(
+    values: np.ndarray, lo: float, hi: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Select values inside [lo, hi] and their histogram bins."""
+    inside = values[(values >= lo) & (values <= hi)]
+    bins = ((inside - lo) * (_N_BINS / (hi - lo))).astype(np.intp)
+    return inside, np.minimum(bins, _N_BINS - 1, out=bins)
+
+
+def _window_histogram(
+    tiles: Iterator[np.ndarray], lo: float, hi: float
+) -> tuple[np.ndarray, int, float, float]:
+    """Count values below [lo, hi], histogram values inside of it and their range."""
+    counts = np.zeros(_N_BINS, dtype=np.int64)
+    below = 0
+    win_min, win_max = np.inf, -np.inf
+    for values in tiles:
+        below += np.count_nonzero(values < lo)
+        inside, bins = _window_bins(values, lo, hi)
+        if len(inside) > 0:
+            win_min = min(win_min, inside.min())
+            win_max = max(win_max, inside.max())
+            counts += np.bincount(bins, minlength=_N_BINS)
+    return counts, below, win_min, win_max
+
+
+def _window_select(
+    tiles: Iterator[np.ndarray],
+    lo: float,
+    hi: float,
+    mid_bins: np.ndarray,
+    ranks: np.ndarray,
+) -> float:
+    """Average order statistics of the values in the middle bins of [lo, hi]."""
+    candidates = []
+    for values in tiles:
+        inside, bins = _window_bins(values, lo, hi)
+        candidates.append(inside[(bins >= mid_bins[0]) & (bins <= mid_bins[1])])
+    return np.mean(np.partition(np.concatenate(candidates), ranks)[ranks])
+
+
+def _pairwise_median(
+    x: np.ndarray,
+    func: Callable[..., np.ndarray],
+    bounds: tuple[float, float],
+    k: int = 0,
+    *,
+    exact: bool = True,
+) -> float:
+    """Calculate median of func(x[i], x[j]) over all pairs with j >= i + k.
+
+    Only the upper triangular of the pairwise matrix is evaluated. `func` should
+    be an element-wise function that writes its result into `out` array.
+    Large matrices are never materialized, they are processed in row tiles.
+    Every pass over the tiles builds a histogram of pairwise values inside
+    a window, which starts as `bounds`, and narrows the window to the bins
+    holding the middle ranks. Passes are repeated until the window holds
+    at most _TILE_ELEMENTS values, only then these values are collected.
+    If `exact` is False, refinement stops as soon as the width of the middle bins
+    is within _APPROX_RTOL of the median, which is interpolated inside them.
+    Input should be finite.
+    """
+    n = len(x)
+    n_pairs = (n - k) * (n - k + 1) // 2
+    if n_pairs <= 0:
+        return np.nan
+    if n_pairs <= _TILE_ELEMENTS:
+        return _partition_median(_upper_pairs(x, func, 0, n - k, k))
+    rows = max(1, _TILE_ELEMENTS // n)
+    ranks = np.array(((n_pairs - 1) // 2, n_pairs // 2))
+
+    def _tiles() -> Iterator[np.ndarray]:
+        for start in range(0, n - k, rows):
+            yield _upper_pairs(x, func, start, min(start + rows, n - k), k)
+
+    lo, hi = bounds
+    while lo != hi:
+        counts, below, win_min, win_max = _window_histogram(_tiles(), lo, hi)
+        # every value left in the window is tied, so it is the median
+        if win_min == win_max:
+            return win_min
+        cum_counts = below + np.cumsum(counts)
+        mid_bins = np.searchsorted(cum_counts, ranks, side="right")
+        before = np.where(mid_bins > 0, cum_counts[mid_bins - 1], below)
+        bin_width = (hi - lo) / _N_BINS
+        if not exact:
+            offsets = (ranks - before + 0.5) / counts[mid_bins]
+            estimate = lo + np.mean(mid_bins + offsets) * bin_width
+            mid_width = (mid_bins[1] - mid_bins[0] + 1) * bin_width
+            if mid_width <= _APPROX_RTOL * abs(estimate):
+                return estimate
+        # edges are padded, so rounding of bin indices can not drop a value
+        pad = max(bin_width * 2.0**-8, 4 * np.spacing(max(abs(lo), abs(hi))))
+        new_lo = max(lo, lo + mid_bins[0] * bin_width - pad)
+        new_hi = min(hi, lo + (mid_bins[1] + 1) * bin_width + pad)
+        if cum_counts[mid_bins[1]] - before[0] <= _TILE_ELEMENTS or (
+            new_lo == lo and new_hi == hi
+        ):
+            return _window_select(_tiles(), lo, hi, mid_bins, ranks - before[0])
+        lo, hi = new_lo, new_hi
+    return lo
+
+
+def _sample_upper_pairs(
+    n: int, size: int, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draw pairs (i, j) with i <= j < n uniformly from the upper triangular.
+
+    A flat index t is drawn and unranked, rows of the triangular are counted
+    from the bottom, so the row r with r * (r + 1) / 2 <= t holds r + 1 pairs.
+    """
+    t = rng.integers(0, n * (n + 1) // 2, size=size, dtype=np.int64)
+    r = ((np.sqrt(8.0 * t + 1.0) - 1.0) * 0.5).astype(np.int64)
+    # float square root could be off by one for large t
+    r -= r * (r + 1) // 2 > t
+    r += (r + 1) * (r + 2) // 2 <= t
+    return t - r * (r + 1) // 2, r
+
+
+@functools.lru_cache(maxsize=128)
+def _sthd_weights(
+    n: int, qs: tuple[float, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate Standard Trimmed Harrell-Davis weights for sorted array of size n.
+
+    Returns the index of the quantile, the index of the sample and the weight
+    for every non-zero weight. The weights depend only on n and q, so they are
+    cached for repeated calls on same-sized arrays.
+    """
+    _qs = np.asarray(qs, dtype=np.float64)
+    n_calculated = 1 / n**0.5  # heuristic suggested by the author
+    a = (n + 1) * _qs
+    b = (n + 1) * (1.0 - _qs)
+    hdi_lo = np.maximum(0.0, _qs - n_calculated * 0.5)
+    hdi_hi = np.minimum(1.0, _qs + n_calculated * 0.5)
+    i_start = np.floor(hdi_lo * n).astype(np.intp)
+    i_end = np.ceil(hdi_hi * n).astype(np.intp)
+    # every quantile owns a segment of i_end - i_start + 1 cdf points
+    sizes = i_end - i_start + 1
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    owner = np.repeat(np.arange(len(_qs)), sizes)
+    nums = (np.arange(ends[-1]) - starts[owner] + i_start[owner]) / n
+    nums = np.clip(nums, hdi_lo[owner], hdi_hi[owner])
+    nums[starts] = hdi_lo
+    nums[ends - 1] = hdi_hi
+    cdfs = special.betainc(a[owner], b[owner], nums)
+    hdi_cdf_lo = cdfs[starts]
+    hdi_cdf_hi = cdfs[ends - 1]
+    cdfs = (cdfs - hdi_cdf_lo[owner]) / (hdi_cdf_hi - hdi_cdf_lo)[owner]
+    # weights are differences of cdfs inside of each segment
+    inner = np.ones(len(cdfs) - 1, dtype=bool)
+    inner[ends[:-1] - 1] = False
+    w = (cdfs[1:] - cdfs[:-1])[inner]
+    w_owner = owner[:-1][inner]
+    w_pos = np.arange(len(w)) - (starts - np.arange(len(_qs)))[w_owner]
+    idx = w_pos + i_start[w_owner]
+    for arr in (w_owner, idx, w):
+        arr.flags.writeable = False
+    return w_owner, idx, w
+
+
+def _sthd_many(x: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    """Calculate Standard Trimmed Harrell-Davis quantiles for many q at once.
+
+    The array is sorted once and the incomplete beta function is evaluated
+    for all quantiles in a single call.
+    """
+    _qs = tuple(float(q) for q in np.ravel(qs))
+    _x = np.sort(_finite(x))
+    n = len(_x)
+    if n == 0:
+        return np.full(len(_qs), np.nan)
+    if n == 1:
+        return np.full(len(_qs), _x[0])
+    owner, idx, w = _sthd_weights(n, _qs)
+    if len(_qs) == 1:
+        return np.array([np.dot(_x[idx], w)])
+    return np.bincount(owner, weights=_x[idx] * w, minlength=len(_qs))
+
+
+def _half_sample_mode_sorted(y: np.ndarray) -> float:
+    """Calculate half sample mode of the sorted finite array."""
+    # heavily inspired by https://github.com/cran/modeest/blob/master/R/hsm.R
+    _corner_cases = (4, 3)  # for 4 samples and 3 samples
+    while (ny := len(y)) >= _corner_cases[0]:
+        half_y = math.ceil(ny / 2)
+        widths = y[half_y - 1 : ny - 1] - y[: ny - half_y]
+        # the last of the narrowest windows is taken
+        j = len(widths) - 1 - np.argmin(widths[::-1])
+        if widths[j] == 0:
+            return y[j]
+        y = y[j : (j + half_y - 1)]
+    if len(y) == _corner_cases[1]:
+        z = 2 * y[1] - y[0] - y[2]
+        if z < 0:
+            return np.mean(y[0:1])
+        if z > 0:
+            return np.mean(y[1:2])
+        return y[1]
+    return np.mean(y)
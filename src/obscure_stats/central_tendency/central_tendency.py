@@ -1,9 +1,22 @@
 """Module for measures of central tendency."""
 
-import math
+from __future__ import annotations
 
 import numpy as np
-from scipy import stats  # type: ignore[import-untyped]
+
+from obscure_stats._utils import (
+    _abs_dev,
+    _finite,
+    _half_sample_mode_sorted,
+    _min_max,
+    _notnan,
+    _pairwise_median,
+    _partition_median,
+    _quantiles_partition,
+    _sample_upper_pairs,
+    _sthd_many,
+    _sum_sumsq,
+)
 
 
 def midrange(x: np.ndarray) -> float:
@@ -27,8 +40,7 @@ def midrange(x: np.ndarray) -> float:
     The Oxford dictionary of Statistical Terms.
     Oxford University Press.
     """
-    maximum = np.nanmax(x)
-    minimum = np.nanmin(x)
+    minimum, maximum = _min_max(_notnan(x))
     return (maximum + minimum) * 0.5
 
 
@@ -53,7 +65,7 @@ def midhinge(x: np.ndarray) -> float:
     Exploratory Data Analysis.
     Addison-Wesley.
     """
-    q1, q3 = np.nanquantile(x, [0.25, 0.75])
+    q1, q3 = _quantiles_partition(_notnan(x), [0.25, 0.75])
     return (q3 + q1) * 0.5
 
 
@@ -78,7 +90,7 @@ def trimean(x: np.ndarray) -> float:
     Exploratory Data Analysis.
     Addison-Wesley.
     """
-    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
+    q1, q2, q3 = _quantiles_partition(_notnan(x), [0.25, 0.5, 0.75])
     return 0.5 * q2 + 0.25 * q1 + 0.25 * q3
 
 
@@ -105,7 +117,8 @@ def contraharmonic_mean(x: np.ndarray) -> float:
     Handbook of means and their inequalities.
     Springer.
     """
-    return np.nansum(np.square(x)) / np.nansum(x)
+    x_sum, x_sumsq = _sum_sumsq(x)
+    return x_sumsq / x_sum
 
 
 def midmean(x: np.ndarray) -> float:
@@ -129,11 +142,17 @@ def midmean(x: np.ndarray) -> float:
     Encyclopedia of Research Design.
     SAGE Publications, Inc.
     """
-    q1, q3 = np.nanquantile(x, [0.25, 0.75])
-    return np.nanmean(np.where((x >= q1) & (x <= q3), x, np.nan))
+    _x = _notnan(x)
+    q1, q3 = _quantiles_partition(_x, [0.25, 0.75])
+    inner = _x[(_x >= q1) & (_x <= q3)]
+    if len(inner) == 0:
+        return np.nan
+    return inner.mean()
 
 
-def hodges_lehmann_sen_location(x: np.ndarray) -> float:
+def hodges_lehmann_sen_location(
+    x: np.ndarray, max_pairs: int | None = None, seed: int | None = None
+) -> float:
     """Calculate Hodges-Lehmann-Sen robust location measure (pseudomedian).
 
     This measure is more robust then average.
@@ -142,6 +161,13 @@ def hodges_lehmann_sen_location(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    max_pairs : int or None, default = None
+        Maximum number of pairwise sums to evaluate. If the number of all pairs
+        exceeds this value, the pseudomedian is approximated with the median of
+        `max_pairs` pairs (i <= j) drawn uniformly at random. If None, the exact
+        value is calculated.
+    seed : int or None, default = None
+        Seed of the random generator used for the pairs sampling.
 
     Returns
     -------
@@ -161,14 +187,24 @@ def hodges_lehmann_sen_location(x: np.ndarray) -> float:
 
     Notes
     -----
-    This implementation uses cartesian product, so the time and memory complexity
-    are N^2. It is best to not use it on large arrays.
+    This implementation evaluates the upper triangular of the cartesian product
+    (Walsh averages), so the time complexity is N^2. For large arrays
+    the product is processed in tiles, so the memory stays bounded.
+    It is best to not use it on large arrays or to set `max_pairs`,
+    which reduces the complexity to O(max_pairs).
     """
-    # In the original paper authors suggest use only upper triangular
-    # of the cartesian product, but in this implementation we use
-    # whole matrix, which is equvalent.
-    product = np.meshgrid(x, x, sparse=True)
-    return np.nanmedian(product[0] + product[1]) * 0.5
+    if max_pairs is not None and max_pairs <= 0:
+        msg = "Parameter max_pairs should be a positive integer."
+        raise ValueError(msg)
+    x = _finite(x)
+    n = len(x)
+    if n == 0:
+        return np.nan
+    if max_pairs is not None and n * (n + 1) // 2 > max_pairs:
+        i, j = _sample_upper_pairs(n, max_pairs, np.random.default_rng(seed))
+        return _partition_median(x[i] + x[j]) * 0.5
+    bounds = (2 * x.min(), 2 * x.max())
+    return _pairwise_median(x, np.add, bounds) * 0.5
 
 
 def standard_trimmed_harrell_davis_quantile(x: np.ndarray, q: float = 0.5) -> float:
@@ -204,26 +240,7 @@ def standard_trimmed_harrell_davis_quantile(x: np.ndarray, q: float = 0.5) -> fl
     if q <= 0 or q >= 1:
         msg = "Parameter q should be in range (0, 1)."
         raise ValueError(msg)
-    _x = np.sort(x)
-    _x = _x[np.isfinite(_x)]
-    n = len(_x)
-    if n == 0:
-        return np.nan
-    if n == 1:
-        return _x[0]
-    n_calculated = 1 / n**0.5  # heuristic suggested by the author
-    a = (n + 1) * q
-    b = (n + 1) * (1.0 - q)
-    hdi = (max(0, q - n_calculated * 0.5), min(1, q + n_calculated * 0.5))
-    hdi_cdf = stats.beta.cdf(hdi, a, b)
-    i_start = int(math.floor(hdi[0] * n))
-    i_end = int(math.ceil(hdi[1] * n))
-    nums = np.arange(i_start, i_end + 1) / n
-    nums[nums <= hdi[0]] = hdi[0]
-    nums[nums >= hdi[1]] = hdi[1]
-    cdfs = (stats.beta.cdf(nums, a, b) - hdi_cdf[0]) / (hdi_cdf[1] - hdi_cdf[0])
-    w = cdfs[1:] - cdfs[:-1]
-    return np.sum(_x[i_start:i_end] * w)
+    return _sthd_many(x, np.asarray([q]))[0]
 
 
 def half_sample_mode(x: np.ndarray) -> float:
@@ -252,29 +269,7 @@ def half_sample_mode(x: np.ndarray) -> float:
     --------
     scipy.stats.mode - Mode estimator.
     """
-    # heavily inspired by https://github.com/cran/modeest/blob/master/R/hsm.R
-    y = np.sort(x)
-    y = y[np.isfinite(y)]
-    _corner_cases = (4, 3)  # for 4 samples and 3 samples
-    while (ny := len(y)) >= _corner_cases[0]:
-        half_y = math.ceil(ny / 2)
-        w_min = y[-1] - y[0]
-        for i in range(ny - half_y):
-            w = y[i + half_y - 1] - y[i]
-            if w <= w_min:
-                w_min = w
-                j = i
-        if w == 0:
-            return y[j]
-        y = y[j : (j + half_y - 1)]
-    if len(y) == _corner_cases[1]:
-        z = 2 * y[1] - y[0] - y[2]
-        if z < 0:
-            return np.mean(y[0:1])
-        if z > 0:
-            return np.mean(y[1:2])
-        return y[1]
-    return np.mean(y)
+    return _half_sample_mode_sorted(np.sort(_finite(x)))
 
 
 def tau_location(x: np.ndarray, c: float = 4.5) -> float:
@@ -303,11 +298,22 @@ def tau_location(x: np.ndarray, c: float = 4.5) -> float:
     if c <= 0:
         msg = "Parameter c should be strictly positive."
         raise ValueError(msg)
-    med = np.nanmedian(x)
-    mad = np.nanmedian(np.abs(x - med))
-    scaled_x = (x - med) / mad
-    w = np.square(1.0 - np.square(scaled_x / c)) * (np.abs(scaled_x) <= c)
-    return np.nansum(x * w) / np.nansum(w)
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    med = _partition_median(_x)
+    # weights are computed in place in a single buffer, they depend only on |x - med|
+    w = _abs_dev(_x, med)
+    mad = _partition_median(w)
+    w /= mad * c
+    np.square(w, out=w)
+    np.subtract(1.0, w, out=w)
+    # values further than c MADs from the median get zero weight
+    np.maximum(w, 0.0, out=w)
+    np.square(w, out=w)
+    # only values with non-zero weight are summed, so infinite values drop out
+    inner = w > 0.0
+    return np.dot(_x[inner], w[inner]) / w.sum()
 
 
 def grenanders_m(x: np.ndarray, p: float = 1.001, k: int = 2) -> float:
@@ -338,9 +344,7 @@ def grenanders_m(x: np.ndarray, p: float = 1.001, k: int = 2) -> float:
     Some direct estimates of the mode.
     Annals of Mathematical Statistics, 36, 131-138.
     """
-    x_sort = np.sort(x)
-    x_sort = x_sort.astype("float")
-    x_sort = x_sort[np.isfinite(x_sort)]
+    x_sort = np.sort(_finite(x))
 
     if p <= 1:
         msg = "Parameter p should be a float greater than 1."
@@ -357,14 +361,11 @@ def grenanders_m(x: np.ndarray, p: float = 1.001, k: int = 2) -> float:
     # if the diffs are constant - return the value
     if diff.sum() == 0.0:
         return x_sort[0]
-    # to avoid division by zero
-    diff[diff == 0.0] = np.nan
-
-    return (
-        0.5
-        * np.nansum((x_sort[k:] + x_sort[:-k]) / np.power(diff, p))
-        / np.nansum(np.power(diff, -p))
-    )
+    # 1 / diff^p == diff^(-p), so one power is enough for both sums,
+    # zero diffs get zero weight to avoid division by zero
+    w = np.zeros_like(diff)
+    np.power(diff, -p, out=w, where=diff != 0.0)
+    return 0.5 * np.dot(x_sort[k:] + x_sort[:-k], w) / w.sum()
 
 
 def gastwirth_location(x: np.ndarray) -> float:
@@ -388,5 +389,5 @@ def gastwirth_location(x: np.ndarray) -> float:
     On Robust Procedures.
     J. Amer. Statist. Assn., Vol. 61, pp. 929-948.
     """
-    p33, p50, p66 = np.nanquantile(x, [1 / 3, 0.5, 2 / 3])
+    p33, p50, p66 = _quantiles_partition(_notnan(x), [1 / 3, 0.5, 2 / 3])
     return 0.3 * p33 + 0.4 * p50 + 0.3 * p66
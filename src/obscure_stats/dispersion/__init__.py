@@ -6,6 +6,7 @@ from .dispersion import (
     coefficient_of_variation,
     cole_index_of_dispersion,
     dispersion_ratio,
+    dispersion_summary,
     fisher_index_of_dispersion,
     gini_mean_difference,
     inter_expectile_range,
@@ -23,6 +24,7 @@ __all__ = [
     "coefficient_of_variation",
     "cole_index_of_dispersion",
     "dispersion_ratio",
+    "dispersion_summary",
     "fisher_index_of_dispersion",
     "gini_mean_difference",
     "inter_expectile_range",
@@ -1,7 +1,28 @@
 """Module for measures of dispersion."""
 
 import numpy as np
-from scipy import special, stats  # type: ignore[import-untyped]
+
+from obscure_stats._utils import (
+    _abs_dev,
+    _columns,
+    _finite,
+    _mean_std,
+    _min_max,
+    _notnan,
+    _pairwise_median,
+    _partition_median,
+    _pwm_betas,
+    _quantiles_partition,
+    _quantiles_sorted_columns,
+    _sorted_notnan,
+    _sum_sumsq,
+)
+
+
+def _abs_diff(x: np.ndarray, y: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Calculate element-wise absolute differences."""
+    np.subtract(x, y, out=out)
+    return np.abs(out, out=out)
 
 
 def studentized_range(x: np.ndarray) -> float:
@@ -23,10 +44,11 @@ def studentized_range(x: np.ndarray) -> float:
     Errors of routine analysis.
     Biometrika. 19 (1/2): 151-164.
     """
-    std = np.nanstd(x)
-    maximum = np.nanmax(x)
-    minimum = np.nanmin(x)
-    return (maximum - minimum) / std
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    min_x, max_x = _min_max(_x)
+    return (max_x - min_x) / _mean_std(_x)[1]
 
 
 def coefficient_of_lvariation(x: np.ndarray) -> float:
@@ -52,13 +74,8 @@ def coefficient_of_lvariation(x: np.ndarray) -> float:
     using linear combinations of order statistics.
     Journal of the Royal Statistical Society, Series B. 52 (1): 105-124.
     """
-    l1 = np.nanmean(x)
-    _x = np.sort(x)
-    n = len(_x)
-    common = 1 / special.comb(n - 1, 1) / n
-    beta_1 = common * np.nansum(special.comb(np.arange(1, n), 1) * _x[1:])
-    l2 = 2 * beta_1 - l1
-    return l2 / l1
+    beta_0, beta_1 = _pwm_betas(_sorted_notnan(x), 2)
+    return (2 * beta_1 - beta_0) / beta_0
 
 
 def coefficient_of_variation(x: np.ndarray) -> float:
@@ -80,7 +97,11 @@ def coefficient_of_variation(x: np.ndarray) -> float:
     Coefficient of Variation.
     Applied Multivariate Statistics in Geohydrology and Related Sciences. Springer.
     """
-    return np.nanstd(x) / np.nanmean(x)
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mean, std = _mean_std(_x)
+    return std / mean
 
 
 def robust_coefficient_of_variation(x: np.ndarray) -> float:
@@ -105,8 +126,11 @@ def robust_coefficient_of_variation(x: np.ndarray) -> float:
     Statistical Data Analysis Explained: Applied Environmental Statistics with R.
     John Wiley and Sons, New York.
     """
-    med = np.nanmedian(x)
-    med_abs_dev = np.nanmedian(np.abs(x - med))
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    med = _partition_median(_x)
+    med_abs_dev = _partition_median(_abs_dev(_x, med), overwrite=True)
     return med_abs_dev / med
 
 
@@ -129,7 +153,7 @@ def quartile_coefficient_of_dispersion(x: np.ndarray) -> float:
     Confidence interval for a coefficient of quartile variation.
     Computational Statistics & Data Analysis. 50 (11): 2953-2957.
     """
-    q1, q3 = np.nanquantile(x, [0.25, 0.75])
+    q1, q3 = _quantiles_partition(_notnan(x), [0.25, 0.75])
     return (q3 - q1) / (q3 + q1)
 
 
@@ -158,9 +182,10 @@ def dispersion_ratio(x: np.ndarray) -> float:
     prior to unsupervised machine learning.
     Statistics, Optimization & Information Computing, 11(2), 519-530.
     """
-    _x = np.asarray(x)
-    _x = np.where(_x == 0, np.nan, _x)
-    return np.nanmean(x) / stats.gmean(_x, nan_policy="omit")
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    return _x.mean() / np.exp(np.log(_x[_x != 0]).mean())
 
 
 def fisher_index_of_dispersion(x: np.ndarray) -> float:
@@ -185,7 +210,10 @@ def fisher_index_of_dispersion(x: np.ndarray) -> float:
     Statistical methods for research workers.
     Hafner, New York.
     """
-    return (len(x) - 1) * np.nanvar(x) / np.nanmean(x)
+    _x = _notnan(x)
+    mean = _x.mean()
+    dev = _x - mean
+    return (len(x) - 1) * np.dot(dev, dev) / len(_x) / mean
 
 
 def morisita_index_of_dispersion(x: np.ndarray) -> float:
@@ -210,8 +238,8 @@ def morisita_index_of_dispersion(x: np.ndarray) -> float:
     Measuring the dispersion and the analysis of distribution patterns.
     Memoirs of the Faculty of Science, Kyushu University Series e. Biol. 2: 215-235
     """
-    x_sum = np.nansum(x)
-    return len(x) * (np.nansum(np.square(x)) - x_sum) / (x_sum**2 - x_sum)
+    x_sum, x_sumsq = _sum_sumsq(x)
+    return len(x) * (x_sumsq - x_sum) / (x_sum**2 - x_sum)
 
 
 def standard_quantile_absolute_deviation(x: np.ndarray) -> float:
@@ -236,16 +264,19 @@ def standard_quantile_absolute_deviation(x: np.ndarray) -> float:
     Quantile absolute deviation.
     arXiv preprint arXiv:2208.13459.
     """
-    med = np.nanmedian(x)
-    n = len(x)
+    _x = _notnan(x)
+    n = len(_x)
+    if n == 0:
+        return np.nan
+    med = _partition_median(_x)
     # finite sample correction
     k = 1.0 + 0.762 / n + 0.967 / n**2
     # constant value that maximizes efficiency for normal distribution
     q = 0.6826894921370850  # stats.norm.cdf(1) - stats.norm.cdf(-1)
-    return k * np.nanquantile(np.abs(x - med), q=q)
+    return k * _quantiles_partition(_abs_dev(_x, med), [q], overwrite=True)[0]
 
 
-def shamos_estimator(x: np.ndarray) -> float:
+def shamos_estimator(x: np.ndarray, *, exact: bool = True) -> float:
     """Calculate Shamos robust estimator of dispersion.
 
     This measure is complementary to Hodges-Lehmann-Sen estimator.
@@ -254,6 +285,11 @@ def shamos_estimator(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    exact : bool, default = True
+        If False, for large arrays the median of pairwise differences is
+        interpolated from a histogram once its bins are narrow enough, which
+        saves the final pass. The relative error is at most 1 / 4096.
+        Small arrays are always exact.
 
     Returns
     -------
@@ -268,18 +304,19 @@ def shamos_estimator(x: np.ndarray) -> float:
 
     Notes
     -----
-    This implementation uses cartesian product, so the time and memory complexity
-    are N^2. It is best to not use it on large arrays.
+    This implementation evaluates the upper triangular of the cartesian product,
+    so the time complexity is N^2. For large arrays the product is processed
+    in tiles, so the memory stays bounded. It is best to not use it on large arrays.
 
     See Also
     --------
     obscure_stats.central_tendency.hodges_lehmann_sen_location - Hodges-Lehmann-Sen loc.
     """
-    # In the original paper authors suggest use only upper triangular
-    # of the cartesian product, but in this implementation we use
-    # whole matrix, which is equvalent.
-    product = np.meshgrid(x, x, sparse=True)
-    return np.nanmedian(np.abs(product[0] - product[1]))
+    _x = _finite(x)
+    if len(_x) == 0:
+        return np.nan
+    bounds = (0.0, _x.max() - _x.min())
+    return _pairwise_median(_x, _abs_diff, bounds, k=1, exact=exact)
 
 
 def coefficient_of_range(x: np.ndarray) -> float:
@@ -301,8 +338,7 @@ def coefficient_of_range(x: np.ndarray) -> float:
     Measures of Dispersion.
     In Biomedical Statistics (pp. 59-70). Springer, Singapore
     """
-    min_ = np.nanmin(x)
-    max_ = np.nanmax(x)
+    min_, max_ = _min_max(_notnan(x))
     return (max_ - min_) / (max_ + min_)
 
 
@@ -327,7 +363,8 @@ def cole_index_of_dispersion(x: np.ndarray) -> float:
     A theory for analyzing contagiously distributed populations.
     Ecology. 27 (4): 329-341.
     """
-    return np.nansum(np.square(x)) / np.nansum(x) ** 2
+    x_sum, x_sumsq = _sum_sumsq(x)
+    return x_sumsq / x_sum**2
 
 
 def gini_mean_difference(x: np.ndarray) -> float:
@@ -350,15 +387,36 @@ def gini_mean_difference(x: np.ndarray) -> float:
     Yitzhaki, S.; Schechtman, E. (2013).
     The Gini Methodology.
     Springer, New York.
+    """
+    _x = _sorted_notnan(x)
+    n = len(_x)
+    # sum of |x_i - x_j| over i < j is sum of (2k - n + 1) * x_k over sorted x
+    ranks = 2 * np.arange(n, dtype=np.float64) - (n - 1)
+    return 2 * np.dot(ranks, _x) / (n * (n - 1))
 
-    Notes
-    -----
-    This implementation uses cartesian product, so the time and memory complexity
-    are N^2. It is best to not use it on large arrays.
+
+def _expectiles_sorted(x: np.ndarray, taus: list[float]) -> list[float]:
+    """Calculate expectiles of the sorted array in closed form.
+
+    An expectile mu solves tau * sum((x - mu)+) = (1 - tau) * sum((mu - x)+).
+    Between two neighbouring order statistics this equation is linear in mu,
+    so it is enough to find the right interval with prefix sums.
     """
     n = len(x)
-    product = np.meshgrid(x, x, sparse=True)
-    return np.nansum(np.abs(product[0] - product[1])) / (n * (n - 1))
+    below = np.arange(n)
+    # sums of the values before each order statistic
+    prefix = np.cumsum(x) - x
+    total = prefix[-1] + x[-1]
+    expectiles = []
+    for tau in taus:
+        # balance of the equation at each order statistic, it is non-increasing
+        g = tau * (total - prefix - x * (n - below)) - (1 - tau) * (x * below - prefix)
+        i = min(int(np.searchsorted(-g, 0.0, side="left")), n - 1)
+        expectiles.append(
+            (tau * (total - prefix[i]) + (1 - tau) * prefix[i])
+            / ((1 - tau) * i + tau * (n - i))
+        )
+    return expectiles
 
 
 def inter_expectile_range(x: np.ndarray) -> float:
@@ -382,8 +440,57 @@ def inter_expectile_range(x: np.ndarray) -> float:
     Implicit expectiles and measures of implied volatility.
     Quantitative Finance, 18(11), pp. 1851-1864.
     """
-    _x = np.ravel(x)
-    _x = _x[np.isfinite(_x)]
+    _x = np.sort(_finite(x))
     if len(_x) <= 1:
         return np.nan
-    return stats.expectile(_x, 0.75) - stats.expectile(_x, 0.25)
+    e25, e75 = _expectiles_sorted(_x, [0.25, 0.75])
+    return e75 - e25
+
+
+def dispersion_summary(x: np.ndarray) -> dict[str, np.ndarray]:
+    """Calculate moment and quantile based measures of dispersion column-wise.
+
+    Every column is treated as a separate sample without its nans.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array of shape (n_observations,) or (n_observations, n_columns).
+
+    Returns
+    -------
+    summary : dict[str, np.ndarray]
+        Mapping from the name of the measure to its values for every column.
+        Computed measures are coefficient_of_range, coefficient_of_variation,
+        cole_index_of_dispersion, fisher_index_of_dispersion,
+        morisita_index_of_dispersion, quartile_coefficient_of_dispersion,
+        robust_coefficient_of_variation and studentized_range.
+    """
+    _x = np.sort(_columns(x), axis=0)
+    n = _x.shape[0]
+    count = (~np.isnan(_x)).sum(axis=0)
+    q1, med, q3 = _quantiles_sorted_columns(_x, count, [0.25, 0.5, 0.75])
+    # nans are sorted to the end of every column, rows past the count are zeroed
+    valid = np.arange(n)[:, None] < count
+    filled = np.where(valid, _x, 0.0)
+    x_sum = filled.sum(axis=0)
+    x_sumsq = np.einsum("ij,ij->j", filled, filled)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = x_sum / count
+        dev = np.where(valid, _x - mean, 0.0)
+        var = np.einsum("ij,ij->j", dev, dev) / count
+        std = np.sqrt(var)
+        min_x = np.fmin.reduce(_x, axis=0)
+        max_x = np.fmax.reduce(_x, axis=0)
+        abs_dev = np.sort(np.abs(_x - med), axis=0)
+        (med_abs_dev,) = _quantiles_sorted_columns(abs_dev, count, [0.5])
+        return {
+            "coefficient_of_range": (max_x - min_x) / (max_x + min_x),
+            "coefficient_of_variation": std / mean,
+            "cole_index_of_dispersion": x_sumsq / x_sum**2,
+            "fisher_index_of_dispersion": (n - 1) * var / mean,
+            "morisita_index_of_dispersion": n * (x_sumsq - x_sum) / (x_sum**2 - x_sum),
+            "quartile_coefficient_of_dispersion": (q3 - q1) / (q3 + q1),
+            "robust_coefficient_of_variation": med_abs_dev / med,
+            "studentized_range": (max_x - min_x) / std,
+        }
@@ -1,7 +1,21 @@
 """Module for measures of kurtosis."""
 
 import numpy as np
-from scipy import special, stats  # type: ignore[import-untyped]
+
+from obscure_stats._utils import (
+    _notnan,
+    _pwm_betas,
+    _quantiles_partition,
+    _sorted_notnan,
+)
+
+# fixed quantile levels, tuples are hashable so their ranks are cached per array size
+_OCTILES = (0.125, 0.25, 0.375, 0.625, 0.75, 0.875)
+_HOGG_QUANTILES = (0.05, 0.5, 0.95)
+_CROW_SIDDIQUI_QUANTILES = (0.025, 0.25, 0.75, 0.975)
+_HEXADECILES = (0.0625, 0.4375, 0.5625, 0.9375)
+_STAUDTE_QUANTILES = (0.1, 1 / 3, 2 / 3, 0.9)
+_SCHMID_TREDE_QUANTILES = (0.125, 0.25, 0.75, 0.875)
 
 
 def l_kurt(x: np.ndarray) -> float:
@@ -27,13 +41,7 @@ def l_kurt(x: np.ndarray) -> float:
     using linear combinations of order statistics.
     Journal of the Royal Statistical Society, Series B. 52 (1): 105-124.
     """
-    _x = np.sort(x)
-    n = len(_x)
-    common = 1 / special.comb(n - 1, (0, 1, 2, 4)) / n
-    betas = [
-        common[i] * np.nansum(special.comb(np.arange(i, n), i) * _x[i:])
-        for i in range(4)
-    ]
+    betas = _pwm_betas(_sorted_notnan(x), 4)
     l4 = 20 * betas[3] - 30 * betas[2] + 12 * betas[1] - betas[0]
     l2 = 2 * betas[1] - betas[0]
     return l4 / l2
@@ -63,7 +71,13 @@ def moors_kurt(x: np.ndarray) -> float:
     The meaning of kurtosis: Darlington reexamined.
     The American Statistician, 40 (4): 283-284,
     """
-    return np.nanvar(stats.zscore(x, nan_policy="omit") ** 2) + 1
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    # var(z^2) + 1 == m4 / m2^2, since mean(z^2) == 1
+    sq_dev = _x - _x.mean()
+    np.square(sq_dev, out=sq_dev)
+    return len(_x) * np.dot(sq_dev, sq_dev) / sq_dev.sum() ** 2
 
 
 def moors_octile_kurt(x: np.ndarray) -> float:
@@ -87,7 +101,7 @@ def moors_octile_kurt(x: np.ndarray) -> float:
     A quantile alternative for kurtosis.
     Journal of the Royal Statistical Society. Series D, 37(1):25-32.
     """
-    o1, o2, o3, o5, o6, o7 = np.nanquantile(x, [0.125, 0.25, 0.375, 0.625, 0.75, 0.875])
+    o1, o2, o3, o5, o6, o7 = _quantiles_partition(_notnan(x), _OCTILES)
     return ((o7 - o5) + (o3 - o1)) / (o6 - o2)
 
 
@@ -113,13 +127,10 @@ def hogg_kurt(x: np.ndarray) -> float:
     More light on the kurtosis and related statistics.
     Journal of the American Statistical Association, 67(338):422-424.
     """
-    p05, p50, p95 = np.nanquantile(x, [0.05, 0.5, 0.95])
-    masked_p95 = np.where(x >= p95, x, np.nan)
-    masked_p05 = np.where(x <= p05, x, np.nan)
-    masked_p50g = np.where(x >= p50, x, np.nan)
-    masked_p50l = np.where(x <= p50, x, np.nan)
-    return (np.nanmean(masked_p95) - np.nanmean(masked_p05)) / (
-        np.nanmean(masked_p50g) - np.nanmean(masked_p50l)
+    _x = _notnan(x)
+    p05, p50, p95 = _quantiles_partition(_x, _HOGG_QUANTILES)
+    return (np.mean(_x, where=_x >= p95) - np.mean(_x, where=_x <= p05)) / (
+        np.mean(_x, where=_x >= p50) - np.mean(_x, where=_x <= p50)
     )
 
 
@@ -147,7 +158,7 @@ def crow_siddiqui_kurt(x: np.ndarray) -> float:
     Robust estimation of location.
     Journal of the American Statistical Association, 62(318):353-389.
     """
-    p025, p25, p75, p975 = np.nanquantile(x, [0.025, 0.25, 0.75, 0.975])
+    p025, p25, p75, p975 = _quantiles_partition(_notnan(x), _CROW_SIDDIQUI_QUANTILES)
     return (p975 - p025) / (p75 - p25)
 
 
@@ -174,7 +185,7 @@ def reza_ma_kurt(x: np.ndarray) -> float:
     ICA and PCA integrated feature extraction for classification.
     2016 IEEE 13th International Conference on Signal Processing (ICSP), 1083-1088.
     """
-    h1, h7, h9, h15 = np.nanquantile(x, [0.0625, 0.4375, 0.5625, 0.9375])
+    h1, h7, h9, h15 = _quantiles_partition(_notnan(x), _HEXADECILES)
     return ((h15 - h9) + (h7 - h1)) / (h15 - h1)
 
 
@@ -202,7 +213,7 @@ def staudte_kurt(x: np.ndarray) -> float:
     Inference for quantile measures of kurtosis, peakedness, and tail weight.
     Communications in Statistics-Theory and Methods, 46(7), 3148-3163.
     """
-    p10, p33, p66, p90 = np.nanquantile(x, [0.1, 1 / 3, 2 / 3, 0.9])
+    p10, p33, p66, p90 = _quantiles_partition(_notnan(x), _STAUDTE_QUANTILES)
     return (p90 - p10) / (p66 - p33)
 
 
@@ -230,5 +241,5 @@ def schmid_trede_peakedness(x: np.ndarray) -> float:
     Simple tests for peakedness, fat tails and leptokurtosis based on quantiles.
     Computational Statistics and Data Analysis, 43, 1-12.
     """
-    p125, p25, p75, p875 = np.nanquantile(x, [0.125, 0.25, 0.75, 0.875])
+    p125, p25, p75, p875 = _quantiles_partition(_notnan(x), _SCHMID_TREDE_QUANTILES)
     return (p875 - p125) / (p75 - p25)
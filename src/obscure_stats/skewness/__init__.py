@@ -15,6 +15,7 @@ from .skewness import (
     pearson_median_skew,
     pearson_mode_skew,
     right_quantile_weight,
+    skewness_summary,
     wauc_skew_gamma,
 )
 
@@ -33,5 +34,6 @@ __all__ = [
     "pearson_median_skew",
     "pearson_mode_skew",
     "right_quantile_weight",
+    "skewness_summary",
     "wauc_skew_gamma",
 ]
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
-from scipy import integrate, special, stats  # type: ignore[import-untyped]
 
-from obscure_stats.central_tendency import half_sample_mode
+from obscure_stats._utils import (
+    _columns,
+    _half_sample_mode_sorted,
+    _mean_std,
+    _median_abs_dev,
+    _notnan,
+    _partition_median,
+    _pwm_betas,
+    _quantiles_partition,
+    _quantiles_sorted,
+    _quantiles_sorted_columns,
+    _sorted_notnan,
+)
 
 
 def l_skew(x: np.ndarray) -> float:
@@ -31,13 +44,7 @@ def l_skew(x: np.ndarray) -> float:
     using linear combinations of order statistics.
     Journal of the Royal Statistical Society, Series B. 52 (1): 105-124.
     """
-    _x = np.sort(x)
-    n = len(_x)
-    common = 1 / special.comb(n - 1, (0, 1, 2)) / n
-    betas = [
-        common[i] * np.nansum(special.comb(np.arange(i, n), i) * _x[i:])
-        for i in range(3)
-    ]
+    betas = _pwm_betas(_sorted_notnan(x), 3)
     l3 = 6 * betas[2] - 6 * betas[1] + betas[0]
     l2 = 2 * betas[1] - betas[0]
     return l3 / l2
@@ -64,9 +71,13 @@ def pearson_mode_skew(x: np.ndarray) -> float:
     Biometrika Tables for Statisticians, vols. I and II.
     Cambridge University Press, Cambridge.
     """
-    mean = np.nanmean(x)
-    mode = stats.mode(x)[0]
-    std = np.nanstd(x)
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mean, std = _mean_std(_x)
+    # the most frequent value, ties resolve to the smallest one
+    values, counts = np.unique(_x, return_counts=True)
+    mode = values[counts.argmax()]
     return (mean - mode) / std
 
 
@@ -92,8 +103,19 @@ def bickel_mode_skew(x: np.ndarray) -> float:
     Robust estimators of the mode and skewness of continuous data.
     Computational Statistics & Data Analysis, Elsevier, 39(2), 153-163.
     """
-    mode = half_sample_mode(x)
-    return np.nanmean(np.sign(x - mode))
+    _x = _sorted_notnan(x)
+    # infinite values are at the ends of the sorted array, the mode uses the rest
+    finite = slice(
+        np.searchsorted(_x, -np.inf, side="right"),
+        np.searchsorted(_x, np.inf, side="left"),
+    )
+    mode = _half_sample_mode_sorted(_x[finite])
+    if np.isnan(mode):
+        return np.nan
+    # mean of signs is the share of values above the mode minus the share below it
+    below = np.searchsorted(_x, mode, side="left")
+    above = len(_x) - np.searchsorted(_x, mode, side="right")
+    return float(above - below) / len(_x)
 
 
 def pearson_median_skew(x: np.ndarray) -> float:
@@ -115,9 +137,11 @@ def pearson_median_skew(x: np.ndarray) -> float:
     Biometrika Tables for Statisticians, vols. I and II.
     Cambridge University Press, Cambridge.
     """
-    mean = np.nanmean(x)
-    median = np.nanmedian(x)
-    std = np.nanstd(x)
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mean, std = _mean_std(_x)
+    median = _partition_median(_x, overwrite=True)
     return 3 * (mean - median) / std
 
 
@@ -144,12 +168,15 @@ def medeen_skew(x: np.ndarray) -> float:
     Measuring Skewness and Kurtosis.
     The Statistician. 33 (4): 391-399.
     """
-    median = np.nanmedian(x)
-    mean = np.nanmean(x)
-    return (mean - median) / np.nanmean(np.abs(x - median))
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mean = _x.mean()
+    median, mean_abs_dev = _median_abs_dev(_x)
+    return (mean - median) / mean_abs_dev
 
 
-def bowley_skew(x: np.ndarray) -> float:
+def bowley_skew(x: np.ndarray, method: str = "linear") -> float:
     """Calculate Bowley's skewness coefficinet.
 
     Also known as Yule-Kendall skewness coefficient.
@@ -161,6 +188,10 @@ def bowley_skew(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    method : str, default = "linear"
+        Method used to estimate quantiles, one of "linear", "lower", "higher"
+        or "nearest" (same as in numpy.quantile). Methods other than linear
+        skip interpolation and select one order statistic per quantile.
 
     Returns
     -------
@@ -173,11 +204,21 @@ def bowley_skew(x: np.ndarray) -> float:
     Elements of Statistics.
     P.S. King and Son, London.
     """
-    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
+    q1, q2, q3 = _quantiles_partition(_notnan(x), [0.25, 0.5, 0.75], method=method)
     return (q3 + q1 - 2 * q2) / (q3 - q1)
 
 
-def groeneveld_skew(x: np.ndarray) -> float:
+def _groeneveld_select(
+    q1: np.ndarray | float, q2: np.ndarray | float, q3: np.ndarray | float
+) -> np.ndarray:
+    """Select the larger of right and left Groeneveld skews element-wise."""
+    num = q3 + q1 - 2 * q2
+    rs = num / (q2 - q1)
+    ls = num / (q3 - q2)
+    return np.where(np.abs(rs) > np.abs(ls), rs, ls)
+
+
+def groeneveld_skew(x: np.ndarray, method: str = "linear") -> float:
     """Calculate Groeneveld's skewness coefficinet.
 
     It is based on quartiles (uncentered, unscaled).
@@ -189,6 +230,10 @@ def groeneveld_skew(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    method : str, default = "linear"
+        Method used to estimate quantiles, one of "linear", "lower", "higher"
+        or "nearest" (same as in numpy.quantile). Methods other than linear
+        skip interpolation and select one order statistic per quantile.
 
     Returns
     -------
@@ -201,13 +246,11 @@ def groeneveld_skew(x: np.ndarray) -> float:
     Measuring Skewness and Kurtosis.
     The Statistician. 33 (4): 391-399.
     """
-    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
-    rs = (q3 + q1 - 2 * q2) / (q2 - q1)
-    ls = (q3 + q1 - 2 * q2) / (q3 - q2)
-    return rs if abs(rs) > abs(ls) else ls
+    q1, q2, q3 = _quantiles_partition(_notnan(x), [0.25, 0.5, 0.75], method=method)
+    return float(_groeneveld_select(q1, q2, q3))
 
 
-def kelly_skew(x: np.ndarray) -> float:
+def kelly_skew(x: np.ndarray, method: str = "linear") -> float:
     """Calculate Kelly's skewness coefficinet.
 
     It is based on deciles (uncentered, unscaled).
@@ -219,6 +262,10 @@ def kelly_skew(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    method : str, default = "linear"
+        Method used to estimate quantiles, one of "linear", "lower", "higher"
+        or "nearest" (same as in numpy.quantile). Methods other than linear
+        skip interpolation and select one order statistic per quantile.
 
     Returns
     -------
@@ -231,7 +278,7 @@ def kelly_skew(x: np.ndarray) -> float:
     Some tests of significance with ordered variables.
     J. R. Stat. Soc. Ser. B Stat. Methodol. 18, 1-31.
     """
-    d1, d5, d9 = np.nanquantile(x, [0.1, 0.5, 0.9])
+    d1, d5, d9 = _quantiles_partition(_notnan(x), [0.1, 0.5, 0.9], method=method)
     return (d9 + d1 - 2 * d5) / (d9 - d1)
 
 
@@ -258,8 +305,13 @@ def hossain_adnan_skew(x: np.ndarray) -> float:
     A New Approach to Determine the Asymmetry of a Distribution.
     Journal of Applied St atistical Science, Vol.15, pp. 127-134.
     """
-    diff = x - np.nanmedian(x)
-    return np.nanmean(diff) / np.nanmean(np.abs(diff))
+    _x = _notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mean = _x.mean()
+    median, mean_abs_dev = _median_abs_dev(_x)
+    # mean of x - median is mean - median, so no deviation array is needed
+    return (mean - median) / mean_abs_dev
 
 
 def forhad_shorna_rank_skew(x: np.ndarray) -> float:
@@ -287,26 +339,61 @@ def forhad_shorna_rank_skew(x: np.ndarray) -> float:
     An Alternative Form of Boxplot.
     arXiv preprint arXiv:1908.06400.
     """
-    _x = np.ravel(x)
-    mr = (np.nanmin(_x) + np.nanmax(_x)) * 0.5
-    arr = np.r_[_x, mr]
-    arr_ranked = stats.rankdata(arr, method="min", nan_policy="omit")
-    diff = arr_ranked[-1] - arr_ranked
-    diff = diff[:-1]
-    return np.nansum(diff) / np.nansum(np.abs(diff))
+    _x = _sorted_notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    mr = (_x[0] + _x[-1]) * 0.5
+    if np.isnan(mr):
+        # midrange of -inf and inf is undefined, so are the ranks
+        return np.nan
+    # min-rank of a value among x and mr is one plus the number of smaller values
+    rank_mr = np.searchsorted(_x, mr, side="left")
+    ranks = np.searchsorted(_x, _x, side="left") + (mr < _x)
+    # ranks are sorted, so differences are positive before the split and not after it
+    split = np.searchsorted(ranks, rank_mr, side="left")
+    pos_sum = rank_mr * split - ranks[:split].sum()
+    neg_sum = rank_mr * (len(ranks) - split) - ranks[split:].sum()
+    return (pos_sum + neg_sum) / (pos_sum - neg_sum)
+
+
+@functools.lru_cache(maxsize=32)
+def _auc_weights(dp: float) -> np.ndarray:
+    """Calculate weights of the weighted AUC skew, they depend only on dp."""
+    half_n = int(1 / dp) // 2
+    w = (np.arange(half_n) / half_n)[::-1]
+    w.flags.writeable = False
+    return w
 
 
-def _auc_skew_gamma(x: np.ndarray, dp: float, w: np.ndarray | float) -> float:
-    """Calculate AUC skew."""
-    n = int(1 / dp)
-    half_n = n // 2
-    qs = np.nanquantile(x, np.r_[np.linspace(0, 1, n), 0.5])
-    med = qs[-1]
-    qs = qs[:-1]
+@functools.lru_cache(maxsize=32)
+def _auc_grid(dp: float) -> tuple[float, ...]:
+    """Calculate quantile levels used in AUC skew, they depend only on dp."""
+    return tuple(np.linspace(0, 1, int(1 / dp)).tolist())
+
+
+def _auc_from_quantiles(
+    qs: np.ndarray, med: np.ndarray | float, dp: float, w: np.ndarray | float
+) -> np.ndarray:
+    """Integrate generalized Bowley skews over the quantile grid along first axis."""
+    half_n = len(qs) // 2
+    if half_n == 0:
+        return np.zeros(qs.shape[1:])
     qs_low = qs[:half_n]
     qs_high = qs[-half_n:]
     skews = (qs_low + qs_high - 2 * med) / (qs_high - qs_low) * w
-    return integrate.trapezoid(skews, dx=dp)
+    # trapezoidal rule on the uniform grid
+    return dp * (skews.sum(axis=0) - 0.5 * (skews[0] + skews[-1]))
+
+
+def _auc_skew_gamma(x: np.ndarray, dp: float, w: np.ndarray | float) -> float:
+    """Calculate AUC skew."""
+    _x = _sorted_notnan(x)
+    if len(_x) == 0:
+        return np.nan
+    # the whole grid of quantiles is read from one sorted copy
+    qs = _quantiles_sorted(_x, _auc_grid(dp))
+    med = _quantiles_sorted(_x, [0.5])[0]
+    return float(_auc_from_quantiles(qs, med, dp, w))
 
 
 def auc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
@@ -362,10 +449,7 @@ def wauc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
     Mean skewness measures.
     arXiv preprint arXiv:1912.06996.
     """
-    n = int(1 / dp)
-    half_n = n // 2
-    w = (np.arange(half_n) / half_n)[::-1]
-    return _auc_skew_gamma(x, dp, w)
+    return _auc_skew_gamma(x, dp, _auc_weights(dp))
 
 
 def cumulative_skew(x: np.ndarray) -> float:
@@ -391,15 +475,18 @@ def cumulative_skew(x: np.ndarray) -> float:
     A robust measure of skewness using cumulative statistic calculation.
     arXiv preprint arXiv:2209.10699.
     """
-    _x = np.sort(x)
+    _x = _sorted_notnan(x)
     n = len(_x)
-    p = np.nancumsum(_x)
-    p = p / p[-1]
-    r = np.arange(n)
-    q = r / n
-    d = q - p
-    w = (2 * r - n) * 3 / n
-    return np.sum(d * w) / np.sum(d)
+    if n == 0:
+        return np.nan
+    # with q = r / n, p = cumsum(x) / sum(x) and w = 3 * (2r - n) / n, sums of
+    # q and q * w have closed forms, while sums of p and p * w are weighted sums of x
+    r = np.arange(n, dtype=np.float64)
+    weights = np.stack((n - r, 3 * (r - 1) * (n - r) / n))
+    sum_p, sum_pw = weights @ _x / _x.sum()
+    sum_q = (n - 1) / 2
+    sum_qw = (n - 1) * (n - 2) / (2 * n)
+    return (sum_qw - sum_pw) / (sum_q - sum_p)
 
 
 def left_quantile_weight(x: np.ndarray, q: float = 0.25) -> float:
@@ -430,8 +517,8 @@ def left_quantile_weight(x: np.ndarray, q: float = 0.25) -> float:
     if q <= min_q or q >= max_q:
         msg = "Parameter q should be in range (0, 0.5)."
         raise ValueError(msg)
-    lower_quantile, q025, upper_quantile = np.nanquantile(
-        x, [q * 0.5, 0.25, (1 - q) * 0.5]
+    lower_quantile, q025, upper_quantile = _quantiles_partition(
+        _notnan(x), [q * 0.5, 0.25, (1 - q) * 0.5]
     )
     return -(upper_quantile + lower_quantile - 2 * q025) / (
         upper_quantile - lower_quantile
@@ -466,9 +553,78 @@ def right_quantile_weight(x: np.ndarray, q: float = 0.75) -> float:
     if q <= min_q or q >= max_q:
         msg = "Parameter q should be in range (0.5, 1.0)."
         raise ValueError(msg)
-    lower_quantile, q075, upper_quantile = np.nanquantile(
-        x, [1 - q * 0.5, 0.75, (1 + q) * 0.5]
+    lower_quantile, q075, upper_quantile = _quantiles_partition(
+        _notnan(x), [1 - q * 0.5, 0.75, (1 + q) * 0.5]
     )
     return (lower_quantile + upper_quantile - 2 * q075) / (
         lower_quantile - upper_quantile
     )
+
+
+def skewness_summary(x: np.ndarray, dp: float = 0.01) -> dict[str, np.ndarray]:
+    """Calculate quantile, moment and L-moment based measures of skewness column-wise.
+
+    Nans are dropped from each column before its quantiles are found
+    with the default linear method. Both AUC measures share the
+    integration step `dp`.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array of shape (n_observations,) or (n_observations, n_columns).
+    dp : float, default = 0.01
+        Step used in calculating area under the curve (integrating).
+
+    Returns
+    -------
+    summary : dict[str, np.ndarray]
+        Mapping from the name of the measure to its values for every column.
+        Computed measures are auc_skew_gamma, bowley_skew, cumulative_skew,
+        groeneveld_skew, hossain_adnan_skew, kelly_skew, l_skew,
+        left_quantile_weight, medeen_skew, pearson_median_skew,
+        right_quantile_weight and wauc_skew_gamma.
+    """
+    _x = np.sort(_columns(x), axis=0)
+    counts = (~np.isnan(_x)).sum(axis=0)
+    grid = _auc_grid(dp)
+    fixed = [0.1, 0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 0.875, 0.9]
+    qs = _quantiles_sorted_columns(_x, counts, [*fixed, *grid])
+    d1, o1, q1, o3, q2, o5, q3, o7, d9 = qs[: len(fixed)]
+    qs_grid = qs[len(fixed) :]
+    # nans are sorted to the end of every column, rows past the count are zeroed
+    r = np.arange(_x.shape[0], dtype=np.float64)[:, None]
+    valid = r < counts
+    filled = np.where(valid, _x, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = filled.sum(axis=0)
+        mean = total / counts
+        dev = np.where(valid, _x - mean, 0.0)
+        std = np.sqrt(np.einsum("ij,ij->j", dev, dev) / counts)
+        mean_abs_dev = np.abs(np.where(valid, _x - q2, 0.0)).sum(axis=0) / counts
+        # probability weighted moments, the same recurrence as in _pwm_betas
+        w1 = r / (counts - 1)
+        w2 = w1 * (r - 1) / (counts - 2)
+        beta_1 = np.einsum("ij,ij->j", w1, filled) / counts
+        beta_2 = np.einsum("ij,ij->j", w2, filled) / counts
+        # sums of cumulative skew terms, the same closed form as in cumulative_skew
+        sum_p = np.einsum("ij,ij->j", counts - r, filled) / total
+        sum_pw = np.einsum("ij,ij->j", 3 * (r - 1) * (counts - r) / counts, filled)
+        sum_pw /= total
+        sum_q = (counts - 1) / 2
+        sum_qw = (counts - 1) * (counts - 2) / (2 * counts)
+        return {
+            "auc_skew_gamma": _auc_from_quantiles(qs_grid, q2, dp, 1.0),
+            "bowley_skew": (q3 + q1 - 2 * q2) / (q3 - q1),
+            "cumulative_skew": (sum_qw - sum_pw) / (sum_q - sum_p),
+            "groeneveld_skew": _groeneveld_select(q1, q2, q3),
+            "hossain_adnan_skew": (mean - q2) / mean_abs_dev,
+            "kelly_skew": (d9 + d1 - 2 * q2) / (d9 - d1),
+            "l_skew": (6 * beta_2 - 6 * beta_1 + mean) / (2 * beta_1 - mean),
+            "left_quantile_weight": -(o3 + o1 - 2 * q1) / (o3 - o1),
+            "medeen_skew": (mean - q2) / mean_abs_dev,
+            "pearson_median_skew": 3 * (mean - q2) / std,
+            "right_quantile_weight": (o5 + o7 - 2 * q3) / (o5 - o7),
+            "wauc_skew_gamma": _auc_from_quantiles(
+                qs_grid, q2, dp, _auc_weights(dp)[:, None]
+            ),
+        }
@@ -10,6 +10,7 @@ from .variation import (
     negative_extropy,
     range_vr,
     renyi_entropy,
+    variation_summary,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     "negative_extropy",
     "range_vr",
     "renyi_entropy",
+    "variation_summary",
 ]
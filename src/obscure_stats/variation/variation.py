@@ -1,9 +1,52 @@
 """Module for measures of categorical variations."""
 
 import math
+from collections import Counter
 
 import numpy as np
-from scipy import stats  # type: ignore[import-untyped]
+
+from obscure_stats._utils import _columns
+
+# integer ranges up to max(_BINCOUNT_MIN_RANGE, _BINCOUNT_RATIO * size) are tabulated
+_BINCOUNT_MIN_RANGE = 2**10
+_BINCOUNT_RATIO = 4
+
+
+def _counts(x: np.ndarray) -> np.ndarray:
+    """Count occurrences of every category, nans are treated as a category."""
+    x = np.asarray(x)
+    if x.dtype.kind in "iub" and x.size:
+        lo, hi = int(x.min()), int(x.max())
+        if hi - lo <= max(_BINCOUNT_MIN_RANGE, _BINCOUNT_RATIO * x.size):
+            # integer codes in a narrow range are tabulated in one linear pass
+            codes = x - x.min() if x.dtype.kind == "u" else x.astype(np.int64) - lo
+            cnts = np.bincount(codes.astype(np.intp, copy=False).ravel())
+            return cnts[cnts > 0]
+    if x.dtype.kind in "OSU":
+        # hashing avoids sorting strings and python objects by comparisons
+        tally = Counter(x.ravel().tolist())
+        cnts = np.fromiter(tally.values(), dtype=np.int64, count=len(tally))
+        # distinct nan objects do not compare equal, so they are merged here
+        nans = np.fromiter(
+            (isinstance(key, float) and math.isnan(key) for key in tally),
+            dtype=bool,
+            count=len(tally),
+        )
+        if np.count_nonzero(nans) > 1:
+            cnts = np.append(cnts[~nans], cnts[nans].sum())
+        return cnts
+    return np.unique(x, return_counts=True, equal_nan=True)[1]
+
+
+def _sum_sq_freq(cnts: np.ndarray) -> float:
+    """Sum of squared category frequencies, without a frequency array."""
+    n = np.float64(cnts.sum())
+    return np.dot(cnts, cnts) / (n * n)
+
+
+def _mod_vr(cnts: np.ndarray) -> float:
+    """Calculate Mode Variation Ratio from category counts."""
+    return 1 - np.max(cnts) / cnts.sum()
 
 
 def mod_vr(x: np.ndarray) -> float:
@@ -31,8 +74,12 @@ def mod_vr(x: np.ndarray) -> float:
     Indices of Qualitative Variation and Political Measurement.
     The Western Political Quarterly. 26 (2): 325-343.
     """
-    cnts = np.unique(x, return_counts=True, equal_nan=True)[1]
-    return 1 - np.max(cnts) / len(x)
+    return _mod_vr(_counts(x))
+
+
+def _range_vr(cnts: np.ndarray) -> float:
+    """Calculate Range Variation Ratio from category counts."""
+    return np.min(cnts) / np.max(cnts)
 
 
 def range_vr(x: np.ndarray) -> float:
@@ -60,8 +107,12 @@ def range_vr(x: np.ndarray) -> float:
     Indices of Qualitative Variation and Political Measurement.
     The Western Political Quarterly. 26 (2): 325-343.
     """
-    cnts = np.unique(x, return_counts=True, equal_nan=True)[1]
-    return np.min(cnts) / np.max(cnts)
+    return _range_vr(_counts(x))
+
+
+def _gibbs_m1(cnts: np.ndarray) -> float:
+    """Calculate Gibbs M1 Index from category counts."""
+    return 1 - _sum_sq_freq(cnts)
 
 
 def gibbs_m1(x: np.ndarray) -> float:
@@ -102,8 +153,13 @@ def gibbs_m1(x: np.ndarray) -> float:
     Blau's index in sociology, psychology and management studies;
     Special case of Tsallis entropy (alpha = 2).
     """
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / len(x)
-    return 1 - np.sum(freq**2)
+    return _gibbs_m1(_counts(x))
+
+
+def _gibbs_m2(cnts: np.ndarray) -> float:
+    """Calculate Gibbs M2 Index from category counts."""
+    k = len(cnts)
+    return (k / (k - 1)) * (1 - _sum_sq_freq(cnts)) if k > 1 else 0
 
 
 def gibbs_m2(x: np.ndarray) -> float:
@@ -131,9 +187,15 @@ def gibbs_m2(x: np.ndarray) -> float:
     The Division of Labor: Conceptualization and Related Measures.
     Social Forces, 53 (3): 468-476.
     """
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / len(x)
-    k = len(freq)
-    return (k / (k - 1)) * (1 - np.sum(freq**2)) if k > 1 else 0
+    return _gibbs_m2(_counts(x))
+
+
+def _b_index(cnts: np.ndarray) -> float:
+    """Calculate B Index from category counts."""
+    k = len(cnts)
+    # geometric mean of k * count / n, computed as a single log reduction
+    gmean = math.exp(np.log(cnts).mean()) * k / cnts.sum()
+    return 1 - math.sqrt(max(0.0, 1 - gmean**2))
 
 
 def b_index(x: np.ndarray) -> float:
@@ -160,9 +222,18 @@ def b_index(x: np.ndarray) -> float:
     Indices of Qualitative Variation and Political Measurement.
     The Western Political Quarterly. 26 (2): 325-343.
     """
-    n = len(x)
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / n
-    return 1 - (1 - (stats.gmean(freq * len(freq) / n)) ** 2) ** 0.5
+    return _b_index(_counts(x))
+
+
+def _avdev(cnts: np.ndarray) -> float:
+    """Calculate Average Deviation Analogue from category counts."""
+    n = cnts.sum()
+    k = len(cnts)
+    mean = n / k
+    dev = cnts / n
+    dev -= mean
+    np.abs(dev, out=dev)
+    return 1 - (dev.sum() / (2 * mean * max(k - 1, 1)))
 
 
 def avdev(x: np.ndarray) -> float:
@@ -189,11 +260,19 @@ def avdev(x: np.ndarray) -> float:
     Indices of Qualitative Variation and Political Measurement.
     The Western Political Quarterly. 26 (2): 325-343.
     """
-    n = len(x)
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / n
-    k = len(freq)
-    mean = n / k
-    return 1 - (np.sum(np.abs(freq - mean)) / (2 * mean * max(k - 1, 1)))
+    return _avdev(_counts(x))
+
+
+def _renyi_entropy(cnts: np.ndarray, alpha: float) -> float:
+    """Calculate Renyi entropy (bits) from category counts."""
+    if alpha == 2:  # noqa: PLR2004
+        # collision entropy shares the simpson sum with gibbs indices
+        return -math.log2(_sum_sq_freq(cnts))
+    freq = cnts / cnts.sum()
+    if alpha == 1:
+        # return Shannon entropy to avoid division by 0
+        return -np.dot(freq, np.log2(freq))
+    return math.log2(float((freq**alpha).sum())) / (1 - alpha)
 
 
 def renyi_entropy(x: np.ndarray, alpha: float = 2) -> float:
@@ -227,11 +306,16 @@ def renyi_entropy(x: np.ndarray, alpha: float = 2) -> float:
     if alpha < 0:
         msg = "Parameter alpha should be positive!"
         raise ValueError(msg)
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / len(x)
-    if alpha == 1:
-        # return Shannon entropy to avoid division by 0
-        return -np.sum(freq * np.log2(freq))
-    return 1 / (1 - alpha) * math.log2(np.sum(freq**alpha))
+    return _renyi_entropy(_counts(x), alpha)
+
+
+def _negative_extropy(cnts: np.ndarray) -> float:
+    """Calculate Negative Information Extropy (bits) from category counts."""
+    p_inv = cnts / cnts.sum()
+    np.subtract(1.0, p_inv, out=p_inv)
+    # p log p vanishes at p = 0, which happens only for a single category
+    p_inv = p_inv[p_inv > 0.0]
+    return -np.dot(p_inv, np.log2(p_inv))
 
 
 def negative_extropy(x: np.ndarray) -> float:
@@ -260,9 +344,13 @@ def negative_extropy(x: np.ndarray) -> float:
     Extropy: Complementary dual of entropy.
     Statistical Science, 30(1), 40-58.
     """
-    freq = np.unique(x, return_counts=True, equal_nan=True)[1] / len(x)
-    p_inv = 1.0 - freq
-    return -np.sum(p_inv * np.log2(p_inv))
+    return _negative_extropy(_counts(x))
+
+
+def _mcintosh_d(cnts: np.ndarray) -> float:
+    """Calculate McIntosh's D from category counts."""
+    n = cnts.sum()
+    return (n - np.dot(cnts, cnts) ** 0.5) / (n - n**0.5)
 
 
 def mcintosh_d(x: np.ndarray) -> float:
@@ -287,6 +375,81 @@ def mcintosh_d(x: np.ndarray) -> float:
     An index of diversity and the relation of certain concepts to diversity.
     Ecology, 48(3), 392-404.
     """
-    n = len(x)
-    counts = np.unique(x, return_counts=True, equal_nan=True)[1]
-    return (n - np.sum(counts**2) ** 0.5) / (n - n**0.5)
+    return _mcintosh_d(_counts(x))
+
+
+def _category_codes(x: np.ndarray) -> np.ndarray:
+    """Encode every category of the flat array as an integer, nans share a code."""
+    if x.dtype == object:
+        index: dict[object, int] = {}
+        return np.fromiter(
+            (
+                index.setdefault(
+                    math.nan if isinstance(v, float) and math.isnan(v) else v,
+                    len(index),
+                )
+                for v in x.tolist()
+            ),
+            dtype=np.intp,
+            count=len(x),
+        )
+    return np.unique(x, return_inverse=True, equal_nan=True)[1].astype(np.intp)
+
+
+def variation_summary(x: np.ndarray) -> dict[str, np.ndarray]:
+    """Calculate measures of qualitative variation column-wise.
+
+    Categories are counted within each column, all nans of a column
+    form a single category.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array of shape (n_observations,) or (n_observations, n_columns).
+
+    Returns
+    -------
+    summary : dict[str, np.ndarray]
+        Mapping from the name of the measure to its values for every column.
+        Computed measures are avdev, b_index, gibbs_m1, gibbs_m2, mcintosh_d,
+        mod_vr, negative_extropy, range_vr and renyi_entropy (with alpha = 2).
+    """
+    _x = _columns(x, dtype=None)
+    n, m = _x.shape
+    # columns are laid out one after another, so codes are sorted column by column
+    codes = np.sort(_category_codes(_x.ravel(order="F")).reshape(m, n), axis=1)
+    first = np.ones(codes.shape, dtype=bool)
+    first[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    # counts of every category present in a column, grouped by column
+    starts = np.flatnonzero(first)
+    cnts = np.diff(starts, append=n * m)
+    col = starts // n
+    col_starts = np.searchsorted(col, np.arange(m))
+    k = np.bincount(col, minlength=m)
+    sum_sq = np.bincount(col, weights=cnts * cnts, minlength=m)
+    if cnts.size:
+        max_cnts = np.maximum.reduceat(cnts, col_starts)
+        min_cnts = np.minimum.reduceat(cnts, col_starts)
+    else:
+        max_cnts = min_cnts = np.zeros(m, dtype=np.intp)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        freq = cnts / n
+        sum_sq_freq = sum_sq / n**2
+        gmean = np.exp(np.bincount(col, weights=np.log(cnts), minlength=m) / k) * k / n
+        mean = n / k
+        abs_dev = np.bincount(col, weights=np.abs(freq - mean[col]), minlength=m)
+        p_inv = 1.0 - freq
+        log_p_inv = np.log2(p_inv, out=np.zeros(cnts.shape), where=p_inv > 0.0)
+        return {
+            "avdev": 1 - abs_dev / (2 * mean * np.maximum(k - 1, 1)),
+            "b_index": 1 - np.sqrt(np.maximum(0.0, 1 - gmean**2)),
+            "gibbs_m1": 1 - sum_sq_freq,
+            "gibbs_m2": np.where(k > 1, k / (k - 1) * (1 - sum_sq_freq), 0.0),
+            "mcintosh_d": (n - np.sqrt(sum_sq)) / (n - n**0.5),
+            "mod_vr": 1 - max_cnts / n,
+            "negative_extropy": -np.bincount(
+                col, weights=p_inv * log_p_inv, minlength=m
+            ),
+            "range_vr": min_cnts / max_cnts,
+            "renyi_entropy": -np.log2(sum_sq_freq),
+        }
@@ -97,6 +97,50 @@ def test_hls(hls_test_data: np.ndarray, hls_test_data_big: list[int]) -> None:
         raise ValueError(msg)
 
 
+def test_hls_max_pairs(hls_test_data: np.ndarray) -> None:
+    """Simple tets case for approximate Hodges-Lehmann-Sen."""
+    result = hodges_lehmann_sen_location(hls_test_data, max_pairs=10_000, seed=42)
+    if result != pytest.approx(3.5):
+        msg = "Results from the test and paper do not match."
+        raise ValueError(msg)
+    with pytest.raises(ValueError, match="Parameter max_pairs should be"):
+        hodges_lehmann_sen_location(hls_test_data, max_pairs=0)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_hls_sampled(seed: int) -> None:
+    """Test that sampled Hodges-Lehmann-Sen is close to the exact value."""
+    # 500 values have 125250 pairs, so only a part of them is sampled
+    x = np.random.default_rng(seed).exponential(size=500)
+    exact = hodges_lehmann_sen_location(x)
+    result = hodges_lehmann_sen_location(x, max_pairs=20_000, seed=seed)
+    if result != pytest.approx(exact, abs=0.02):
+        msg = "Sampled result is too far from the exact one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_hls_tiled(seed: int) -> None:
+    """Test that tiled Hodges-Lehmann-Sen matches the dense computation."""
+    rng = np.random.default_rng(seed)
+    x = np.round(rng.normal(size=3000), 2)
+    expected = np.median(np.add.outer(x, x)[np.triu_indices(len(x))]) * 0.5
+    if hodges_lehmann_sen_location(x) != pytest.approx(expected):
+        msg = "Tiled result does not match the dense one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("levels", [1, 3])
+def test_hls_tiled_ties_outlier(levels: int) -> None:
+    """Test that tiled Hodges-Lehmann-Sen handles ties and an outlier."""
+    rng = np.random.default_rng(42)
+    x = np.append(rng.integers(0, levels, size=3000), 1e9).astype(np.float64)
+    expected = np.median(np.add.outer(x, x)[np.triu_indices(len(x))]) * 0.5
+    if hodges_lehmann_sen_location(x) != pytest.approx(expected):
+        msg = "Tiled result does not match the dense one."
+        raise ValueError(msg)
+
+
 def test_hsm(hsm_test_data: np.ndarray) -> None:
     """Simple tets case for correctness of Half Sample Mode."""
     result = half_sample_mode(hsm_test_data)
@@ -132,6 +176,14 @@ def test_tau_location(x_array_float: np.ndarray, c: float) -> None:
         tau_location(x_array_float, c=c)
 
 
+def test_tau_location_inf(x_array_float: np.ndarray) -> None:
+    """Test that infinite values get zero weight in Tau location."""
+    result = tau_location(np.append(x_array_float, [np.inf, -np.inf]))
+    if result != pytest.approx(tau_location(np.append(x_array_float, [1e300, -1e300]))):
+        msg = "Infinite values should be treated as outliers."
+        raise ValueError(msg)
+
+
 def test_grenaders_m(x_array_float: np.ndarray) -> None:
     """Test that function will raise error if p or k parameters are incorrect."""
     with pytest.raises(ValueError, match="Parameter p should be a float"):
@@ -8,6 +8,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import array_shapes, arrays
+from scipy import stats
 
 from obscure_stats.dispersion import (
     coefficient_of_lvariation,
@@ -15,6 +16,7 @@ from obscure_stats.dispersion import (
     coefficient_of_variation,
     cole_index_of_dispersion,
     dispersion_ratio,
+    dispersion_summary,
     fisher_index_of_dispersion,
     gini_mean_difference,
     inter_expectile_range,
@@ -25,6 +27,7 @@ from obscure_stats.dispersion import (
     standard_quantile_absolute_deviation,
     studentized_range,
 )
+from obscure_stats.dispersion.dispersion import _expectiles_sorted
 
 all_functions = [
     coefficient_of_lvariation,
@@ -43,6 +46,17 @@ all_functions = [
     studentized_range,
 ]
 
+summary_functions = [
+    coefficient_of_range,
+    coefficient_of_variation,
+    cole_index_of_dispersion,
+    fisher_index_of_dispersion,
+    morisita_index_of_dispersion,
+    quartile_coefficient_of_dispersion,
+    robust_coefficient_of_variation,
+    studentized_range,
+]
+
 
 @pytest.mark.parametrize("func", all_functions)
 @pytest.mark.parametrize(
@@ -53,7 +67,12 @@ def test_mock_aggregation_functions(
 ) -> None:
     """Test for different data types."""
     data = request.getfixturevalue(data)
-    func(data)
+    res = func(data)
+    if func in summary_functions:
+        values = dispersion_summary(data)[func.__name__]
+        if values.shape != (1,) or values[0] != pytest.approx(res):
+            msg = "Summary of 1D input should match the function result."
+            raise ValueError(msg)
 
 
 @pytest.mark.parametrize(
@@ -90,12 +109,112 @@ def test_dispersion_sensibility(func: typing.Callable, seed: int) -> None:
         raise ValueError(msg)
 
 
+def test_shamos_no_self_differences() -> None:
+    """Test that Shamos estimator ignores differences of a value with itself."""
+    if shamos_estimator([1, 4]) != pytest.approx(3.0):
+        msg = "Shamos estimator of [1, 4] should be equal to 3."
+        raise ValueError(msg)
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=51)
+    diffs = np.abs(np.subtract.outer(x, x))[np.triu_indices(len(x), 1)]
+    if shamos_estimator(x) != pytest.approx(np.median(diffs)):
+        msg = "Result does not match the median of differences with i < j."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_shamos_tiled(seed: int) -> None:
+    """Test that tiled Shamos estimator matches the dense computation."""
+    rng = np.random.default_rng(seed)
+    x = np.round(rng.normal(size=3000), 2)
+    diffs = np.abs(np.subtract.outer(x, x))[np.triu_indices(len(x), 1)]
+    if shamos_estimator(x) != pytest.approx(np.median(diffs)):
+        msg = "Tiled result does not match the dense one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("outliers", [[], [1e9]])
+@pytest.mark.parametrize("seed", [1, 42])
+def test_shamos_approximate(seed: int, outliers: list[float]) -> None:
+    """Test that approximate Shamos estimator has bounded relative error."""
+    rng = np.random.default_rng(seed)
+    x = np.append(rng.normal(size=3000), outliers)
+    exact = shamos_estimator(x)
+    if abs(shamos_estimator(x, exact=False) - exact) > exact / 4096:
+        msg = "Approximate result is too far from the exact one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_gini_mean_difference_pairwise(seed: int) -> None:
+    """Test that Gini Mean Difference matches the mean of pairwise differences."""
+    rng = np.random.default_rng(seed)
+    x = np.round(rng.normal(size=300), 1)
+    x[::17] = np.nan
+    gmd = gini_mean_difference(x)
+    _x = x[~np.isnan(x)]
+    n = len(_x)
+    if gmd != pytest.approx(np.abs(_x[:, None] - _x).sum() / (n * (n - 1))):
+        msg = "Gini Mean Difference does not match the pairwise definition."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("alpha", [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99])
+@pytest.mark.parametrize("seed", [1, 42])
+def test_expectiles_scipy(alpha: float, seed: int) -> None:
+    """Test that closed form expectiles match the iterative scipy solution."""
+    rng = np.random.default_rng(seed)
+    x = np.sort(np.round(rng.lognormal(size=500), 1))
+    (expectile,) = _expectiles_sorted(x, [alpha])
+    if expectile != pytest.approx(stats.expectile(x, alpha)):
+        msg = f"Expectile at {alpha} does not match the scipy one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_inter_expectile_range_scipy(seed: int) -> None:
+    """Test that inter expectile range matches the iterative scipy solution."""
+    rng = np.random.default_rng(seed)
+    x = np.round(rng.lognormal(size=500), 1)
+    ier = inter_expectile_range(x)
+    if ier != pytest.approx(stats.expectile(x, 0.75) - stats.expectile(x, 0.25)):
+        msg = "Inter expectile range does not match the scipy one."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("func", all_functions)
+def test_float32_input(func: typing.Callable, x_array_nan: np.ndarray) -> None:
+    """Test that float32 input gives the same result as its float64 upcast."""
+    x32 = x_array_nan.astype(np.float32)
+    if func(x32) != pytest.approx(func(x32.astype(np.float64))):
+        msg = "Float32 result does not match the float64 one."
+        raise ValueError(msg)
+
+
+def test_range_blocked() -> None:
+    """Test that blocked min/max matches the plain reductions."""
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=2**17 + 3)
+    expected = (x.max() - x.min()) / (x.max() + x.min())
+    if coefficient_of_range(x) != pytest.approx(expected):
+        msg = "Blocked result does not match the plain one."
+        raise ValueError(msg)
+
+
 @pytest.mark.parametrize("func", all_functions)
 def test_statistic_with_nans(func: typing.Callable, x_array_nan: np.ndarray) -> None:
     """Test for different data types."""
     if math.isnan(func(x_array_nan)):
         msg = "Statistic should not return nans."
         raise ValueError(msg)
+    if func in summary_functions:
+        x = np.column_stack(
+            [x_array_nan, 3 * x_array_nan[::-1], np.full_like(x_array_nan, np.nan)]
+        )
+        expected = [func(x[:, 0]), func(x[:, 1]), np.nan]
+        if dispersion_summary(x)[func.__name__] != pytest.approx(expected, nan_ok=True):
+            msg = "Summary should match the function applied to each column."
+            raise ValueError(msg)
 
 
 @given(
@@ -109,3 +228,9 @@ def test_statistic_with_nans(func: typing.Callable, x_array_nan: np.ndarray) ->
 def test_fuzz_dispersions(func: typing.Callable, data: np.ndarray) -> None:
     """Test all functions with fuzz."""
     func(data)
+
+
+def test_dispersion_summary_ndim() -> None:
+    """Test that summary rejects arrays with more than two dimensions."""
+    with pytest.raises(ValueError, match="Parameter x should be a 1D or 2D array."):
+        dispersion_summary(np.ones((2, 2, 2)))
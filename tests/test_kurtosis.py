@@ -8,6 +8,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.numpy import array_shapes, arrays
+from scipy import special
 
 from obscure_stats.kurtosis import (
     crow_siddiqui_kurt,
@@ -68,6 +69,36 @@ def test_statistic_with_nans(func: typing.Callable, x_array_nan: np.ndarray) ->
         raise ValueError(msg)
 
 
+def test_l_kurt_small_sample() -> None:
+    """Test L-Kurtosis against the hand-computed value."""
+    # b = (4, 3, 2.5, 2.2), so l2 = 2 and l4 = 1
+    lkr = l_kurt([10.0, np.nan, 3.0, 1.0, 4.0, 2.0])
+    if lkr != pytest.approx(0.5):
+        msg = f"L-Kurtosis of the sample should be equal to 0.5, got {lkr}"
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_l_kurt_normal(seed: int) -> None:
+    """Test L-Kurtosis against binomial weights and the normal distribution."""
+    rng = np.random.default_rng(seed)
+    x = np.sort(rng.normal(size=100_000))
+    n = len(x)
+    betas = [
+        np.dot(special.comb(np.arange(n), r) / special.comb(n - 1, r), x) / n
+        for r in range(4)
+    ]
+    l4 = 20 * betas[3] - 30 * betas[2] + 12 * betas[1] - betas[0]
+    l2 = 2 * betas[1] - betas[0]
+    lkr = l_kurt(x)
+    if lkr != pytest.approx(l4 / l2):
+        msg = f"L-Kurtosis does not match the binomial weights, got {lkr}"
+        raise ValueError(msg)
+    if lkr != pytest.approx(0.1226, abs=0.005):
+        msg = f"L-Kurtosis of normal distribution should be near 0.1226, got {lkr}"
+        raise ValueError(msg)
+
+
 @given(
     arrays(
         dtype=np.float64,
@@ -24,6 +24,7 @@ from obscure_stats.skewness import (
     pearson_median_skew,
     pearson_mode_skew,
     right_quantile_weight,
+    skewness_summary,
     wauc_skew_gamma,
 )
 
@@ -45,6 +46,21 @@ all_functions = [
     wauc_skew_gamma,
 ]
 
+summary_functions = [
+    auc_skew_gamma,
+    bowley_skew,
+    cumulative_skew,
+    groeneveld_skew,
+    hossain_adnan_skew,
+    kelly_skew,
+    l_skew,
+    left_quantile_weight,
+    medeen_skew,
+    pearson_median_skew,
+    right_quantile_weight,
+    wauc_skew_gamma,
+]
+
 
 @pytest.mark.parametrize("func", all_functions)
 @pytest.mark.parametrize(
@@ -68,6 +84,11 @@ def test_skew_sensibility(func: typing.Callable, seed: int) -> None:
     left_skew = np.round(rng.exponential(size=100) + 1, 2)
     no_skew_res = func(no_skew)
     left_skew_res = func(left_skew)
+    if func in summary_functions and skewness_summary(
+        np.column_stack([no_skew, left_skew])
+    )[func.__name__] != pytest.approx([no_skew_res, left_skew_res]):
+        msg = "Summary should match the function applied to each column."
+        raise ValueError(msg)
     if func.__name__ == "right_quantile_weight":
         # ugly but more harmonized this way
         no_skew_res = -no_skew_res
@@ -87,14 +108,31 @@ def test_rank_skew(rank_skewness_test_data: np.ndarray) -> None:
     ):
         msg = "Results from the test and paper do not match."
         raise ValueError(msg)
+    if not math.isnan(forhad_shorna_rank_skew([1.0, -np.inf, 2.0, np.inf])):
+        msg = "Rank skewness with undefined midrange should be nan."
+        raise ValueError(msg)
+    if forhad_shorna_rank_skew([1.0, 2.0, 3.0, np.inf]) != pytest.approx(1.0):
+        msg = "Rank skewness with infinite midrange should be equal to 1."
+        raise ValueError(msg)
 
 
 @pytest.mark.parametrize("func", all_functions)
 def test_statistic_with_nans(func: typing.Callable, x_array_nan: np.ndarray) -> None:
     """Test for different data types."""
-    if math.isnan(func(x_array_nan)):
+    res = func(x_array_nan)
+    if math.isnan(res):
         msg = "Statistic should not return nans."
         raise ValueError(msg)
+    if func in summary_functions:
+        x = np.column_stack([x_array_nan, np.full_like(x_array_nan, np.nan)])
+        if skewness_summary(x)[func.__name__] != pytest.approx(
+            [res, np.nan], nan_ok=True
+        ):
+            msg = "Column of nans should give nan without affecting other columns."
+            raise ValueError(msg)
+        if skewness_summary(x_array_nan)[func.__name__] != pytest.approx([res]):
+            msg = "1D input should be treated as a single column."
+            raise ValueError(msg)
 
 
 @pytest.mark.parametrize("func", [right_quantile_weight, left_quantile_weight])
@@ -116,3 +154,26 @@ def test_q_in_qw(x_array_float: np.ndarray, func: typing.Callable, q: float) ->
 def test_fuzz_skewnesses(func: typing.Callable, data: np.ndarray) -> None:
     """Test all functions with fuzz."""
     func(data)
+
+
+def test_skewness_summary_ndim() -> None:
+    """Test that summary rejects arrays with more than two dimensions."""
+    with pytest.raises(ValueError, match="Parameter x should be a 1D or 2D array."):
+        skewness_summary(np.ones((2, 2, 2)))
+
+
+@pytest.mark.parametrize("method", ["linear", "lower", "higher", "nearest"])
+def test_quantile_method(method: str, x_array_float: np.ndarray) -> None:
+    """Test that quantile methods select the same order statistics as numpy."""
+    q1, q2, q3 = np.quantile(x_array_float, [0.25, 0.5, 0.75], method=method)
+    if bowley_skew(x_array_float, method=method) != pytest.approx(
+        (q3 + q1 - 2 * q2) / (q3 - q1)
+    ):
+        msg = f"Method {method} does not match numpy."
+        raise ValueError(msg)
+
+
+def test_quantile_method_invalid(x_array_float: np.ndarray) -> None:
+    """Test that unknown quantile method raises."""
+    with pytest.raises(ValueError, match="Parameter method should be one of"):
+        bowley_skew(x_array_float, method="midpoint")
@@ -1,6 +1,7 @@
 """Collection of tests of variation module."""
 
 import math
+import tracemalloc
 import typing
 
 import numpy as np
@@ -19,6 +20,7 @@ from obscure_stats.variation import (
     negative_extropy,
     range_vr,
     renyi_entropy,
+    variation_summary,
 )
 
 all_functions = [
@@ -53,6 +55,11 @@ def test_var_sensibility_higher_better(func: typing.Callable, seed: int) -> None
     high_var = rng.choice(["a", "b", "c", "d"], p=[0.75, 0.15, 0.05, 0.05], size=100)
     low_var_res = func(low_var)
     high_var_res = func(high_var)
+    if variation_summary(np.column_stack([low_var, high_var]))[
+        func.__name__
+    ] != pytest.approx([low_var_res, high_var_res]):
+        msg = "Summary should match the function applied to each column."
+        raise ValueError(msg)
     if low_var_res < high_var_res:
         msg = f"Statistic value should be higher, got {low_var_res} < {high_var_res}"
         raise ValueError(msg)
@@ -80,6 +87,81 @@ def test_renyi_entropy_edgecases(c_array_obj: np.ndarray) -> None:
         raise ValueError(msg)
 
 
+def test_b_index_bounds() -> None:
+    """Test that B index spans the 0-1 range."""
+    uniform = np.asarray(["a", "b", "c", "d"] * 5)
+    if b_index(uniform) != pytest.approx(1.0):
+        msg = "B index of uniform categories should be equal to 1."
+        raise ValueError(msg)
+    if not 0.0 <= b_index(np.asarray(["a"] * 7 + ["b"])) < 1.0:
+        msg = "B index should be in 0-1 range."
+        raise ValueError(msg)
+
+
+def test_negative_extropy_single_category() -> None:
+    """Test that a single category has no extropy."""
+    if negative_extropy(np.asarray(["a"] * 5)) != 0.0:
+        msg = "Negative extropy of a single category should be equal to 0."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("func", all_functions)
+def test_object_counts(func: typing.Callable, c_list_obj: list[str]) -> None:
+    """Test that object arrays give the same result as string arrays."""
+    x = np.asarray([*c_list_obj, float("nan"), float("nan")], dtype=object)
+    if func(x) != pytest.approx(func(x.astype(str))):
+        msg = "Object arrays should give the same result as string arrays."
+        raise ValueError(msg)
+    nans = np.asarray([float("nan") for _ in x], dtype=object)
+    if variation_summary(np.column_stack([x, nans]))[func.__name__] != pytest.approx(
+        [func(x), func(np.zeros(len(x)))]
+    ):
+        msg = "Distinct nan objects of a column should form a single category."
+        raise ValueError(msg)
+
+
+def test_variation_summary_wide() -> None:
+    """Test summary of many columns of distinct floats."""
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=(1000, 200))
+    x[::7, ::3] = 0.0
+    tracemalloc.start()
+    summary = variation_summary(x)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if peak > 32 * x.nbytes:
+        msg = f"Summary memory should be linear in the input size, got {peak} bytes."
+        raise ValueError(msg)
+    for func in all_functions:
+        if summary[func.__name__] != pytest.approx([func(col) for col in x.T]):
+            msg = f"Summary of {func.__name__} does not match the column-wise one."
+            raise ValueError(msg)
+    with pytest.raises(ValueError, match="Parameter x should be a 1D or 2D array."):
+        variation_summary(x[:, :, None])
+
+
+@pytest.mark.parametrize("dtype", ["int8", "uint64", "int64", "bool"])
+@pytest.mark.parametrize("func", all_functions)
+def test_integer_counts(func: typing.Callable, dtype: str) -> None:
+    """Test that integer codes give the same result as categories."""
+    x = np.asarray([0, 1, 1, 0, 1, 1, 1], dtype=dtype)
+    if func(x) != pytest.approx(func(x.astype(str))):
+        msg = "Integer codes should give the same result as categories."
+        raise ValueError(msg)
+    if variation_summary(x)[func.__name__] != pytest.approx([func(x)]):
+        msg = "1D input should be treated as a single column."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("func", all_functions)
+def test_integer_counts_wide_range(func: typing.Callable) -> None:
+    """Test that few integers spread over a wide range are counted correctly."""
+    x = np.asarray([0, 10**6, -(2**62), 2**62, 0, 10**6, 0])
+    if func(x) != pytest.approx(func(x.astype(str))):
+        msg = "Integer codes should give the same result as categories."
+        raise ValueError(msg)
+
+
 @given(
     arrays(
         dtype=np.object_,